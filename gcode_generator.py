@@ -1,6 +1,7 @@
 import math
 import os
-import matplotlib.pyplot as plt
+import sys
+import numpy as np
 
 #-----CONFIGURABLE PARAMS-----
 filename = "test.nc"
@@ -15,13 +16,68 @@ cut_angle_deg = 56
 cut_speed_ipm = 1.0
 #-----------------------------
 
-move_log = []  # List of tuples: (x0, z0, x1, z1, type)
+# Derived constants, computed once rather than on every move
+_TAN_INV = 1.0 / math.tan(math.radians(cut_angle_deg))  # X travel per unit of Z travel along the cut angle
+_Z_TOTAL = cut_depth_in + z_retract_height_in  # Z travel of each angled cut/retract
+_NUM_CUTS = int(wax_length_in / cut_spacing_in)
+_G01_TPL = f"G01 X%.4f Z%.4f F{cut_speed_ipm}."  # Angled cut/retract line, formatted with (x, z)
+
+# Move kinds stored in move_kinds. These are also the op codes of .bgc files, so keep the values fixed.
+MOVE_RAPID, MOVE_SLOW, MOVE_CUT, MOVE_RETRACT = 0, 1, 2, 3
+
+# Move log, stored as parallel arrays of the XZ position reached by each move.
+# Sized for the two setup moves plus the slow move, cut and retract of every cut.
+_NUM_MOVES = 3 * _NUM_CUTS + 2
+move_xs = np.empty(_NUM_MOVES)
+move_zs = np.empty(_NUM_MOVES)
+move_kinds = np.empty(_NUM_MOVES, dtype=np.int8)
+move_count = 0
+
+# Record layout of the binary .bgc move file: move kind (op codes are the MOVE_* constants),
+# then the XZ position reached
+BGC_DTYPE = np.dtype([('op', 'u1'), ('x', '<f4'), ('z', '<f4')])
+
+_gcode_buffer: list[str] = []  # G-code lines, flushed to `filename` once at the end of main()
 
 
 def write(lines):
-    with open(filename, 'a') as f:
-        for line in lines:
-            f.write(line + '\n')
+    _gcode_buffer.extend(lines)
+
+
+def flush():
+    # Encode once and write bytes, using the platform line ending that text mode would have written
+    data = (os.linesep.join(_gcode_buffer) + os.linesep).encode('ascii')
+    with open(filename, 'wb') as f:
+        f.write(data)
+
+
+def write_binary(path):
+    """
+    Writes the move log as packed BGC_DTYPE records (9 bytes per move), a compact
+    alternative to the ASCII G-code for analysis or pipelining.
+
+    Parameters:
+        path: Output file path.
+    """
+    records = np.empty(move_count, dtype=BGC_DTYPE)
+    records['op'] = move_kinds[:move_count]
+    records['x'] = move_xs[:move_count]
+    records['z'] = move_zs[:move_count]
+    with open(path, 'wb') as f:
+        records.tofile(f)
+
+
+def log_move(x, z, kind):
+    """
+    Records a move in the move log. A coordinate of None means that axis did not move.
+    """
+    global move_count
+    last_x = move_xs[move_count - 1] if move_count else 0.0
+    last_z = move_zs[move_count - 1] if move_count else 0.0
+    move_xs[move_count] = x if x is not None else last_x
+    move_zs[move_count] = z if z is not None else last_z
+    move_kinds[move_count] = kind
+    move_count += 1
 
 
 def write_header():
@@ -45,111 +101,102 @@ def rapid_move(x, y, z):
         x, y, z: Target coordinates for the rapid move.
     """
     gcode_lines = [
-        f"G00 X{x:.4f} Y{y:.4f}",
-        f"G43 Z{z:.4f} H01"
+        "G00 X%.4f Y%.4f" % (x, y),
+        "G43 Z%.4f H01" % z
     ]
     write(gcode_lines)
 
     # Log rapid move in XZ
-    move_log.append((x, z, 'rapid'))
+    log_move(x, z, MOVE_RAPID)
 
 
 def slow_move_z(z, speed_ipm):
     gcode_lines = [
-        f"G01 Z{z:.4f} F{speed_ipm:.4f}",
-    ]
-    write(gcode_lines)
-
-    move_log.append((None, z, 'slow'))
-
-def slow_move_x(x, speed_ipm):
-    gcode_lines = [
-        f"G01 X{x:.4f} F{speed_ipm:.4f}",
+        "G01 Z%.4f F%.4f" % (z, speed_ipm),
     ]
     write(gcode_lines)
 
-    move_log.append((x, None, 'slow'))
+    log_move(None, z, MOVE_SLOW)
 
-def angular_move(angle_deg: float, current_x: float, current_z: float, z_depth: float, down: bool = False):
+def cut_moves(speed_ipm):
     """
-    Move along a diagonal in the XZ plane at a specified angle and Z depth.
+    Emits every cut along the wax: a slow X move to the retracted position, an angled
+    cut down into the material and an angled retract back up to z_retract_height_in.
 
-    Parameters:
-        angle_deg: Angle from horizontal (in degrees).
-        current_x, current_z: Starting X and Z positions.
-        z_depth: Total Z distance to move.
-        down: If True, moves down into material; otherwise retracts.
+    The toolpath for all cuts is computed with NumPy array operations straight into the
+    move log, and the G-code is formatted from the log.
 
-    Returns:
-        (new_x, new_z): The target coordinates after the move.
+    Parameters:
+        speed_ipm: Feed rate for the X move between cuts.
     """
-    angle_rad = math.radians(angle_deg)
-    dz = abs(z_depth)
-    dx = dz / math.tan(angle_rad)
-
-    if not down:
-        dx = -dx
-        z_depth = -z_depth
-
-    target_x = current_x + dx
-    target_z = current_z - z_depth
-
-    gcode_lines = [
-        f"G01 X{target_x:.4f} Z{target_z:.4f} F{cut_speed_ipm}."
-    ]
-    write(gcode_lines)
-
-    move_type = 'cut' if down else 'retract'
-    move_log.append((target_x, target_z, move_type))
-
-    return target_x, target_z
+    global move_count
+
+    dx = _Z_TOTAL * _TAN_INV
+    inserted_z = z_retract_height_in - _Z_TOTAL
+    last_z = z_retract_height_in
+
+    start, end = move_count, move_count + 3 * _NUM_CUTS
+    move_xs[start:end:3] = np.arange(_NUM_CUTS) * cut_spacing_in
+    move_xs[start + 1:end:3] = move_xs[start:end:3] + dx
+    move_xs[start + 2:end:3] = move_xs[start:end:3]  # The retract runs back along the cut to where it started
+    move_zs[start] = move_zs[start - 1] if start else 0.0
+    move_zs[start + 3:end:3] = last_z
+    move_zs[start + 1:end:3] = inserted_z
+    move_zs[start + 2:end:3] = last_z
+    move_kinds[start:end:3] = MOVE_SLOW
+    move_kinds[start + 1:end:3] = MOVE_CUT
+    move_kinds[start + 2:end:3] = MOVE_RETRACT
+    move_count = end
+
+    xs = move_xs[start:end].tolist()
+    zs = move_zs[start:end].tolist()
+
+    # Bind the templates to locals so the comprehension does not look up globals per line
+    slow_tpl = f"G01 X%.4f F{speed_ipm:.4f}"
+    cut_tpl = _G01_TPL
+    write([
+        line
+        for rx, ix, iz, lx, lz in zip(xs[0::3], xs[1::3], zs[1::3], xs[2::3], zs[2::3])
+        for line in (slow_tpl % rx, cut_tpl % (ix, iz), cut_tpl % (lx, lz))
+    ])
 
 
 def plot_moves():
-    fig, ax = plt.subplots()
+    import matplotlib.pyplot as plt
+    from matplotlib.collections import LineCollection
 
-    last_x, last_z = 0.0, 0.0  # Start at origin or set initial known position
-    for move in move_log[:50]:  # Limit to first 50
-        x, z, move_type = move
-
-        x = x if x is not None else last_x
-        z = z if z is not None else last_z
-
-        color = {
-            'rapid': 'blue',
-            'cut': 'red',
-            'retract': 'green',
-            'slow': 'orange'
-        }.get(move_type, 'black')
-
-        style = '--' if move_type in ('rapid', 'slow') else '-'
-
-        label = {
-            'rapid': 'Rapid Move',
-            'cut': 'Cut Down',
-            'retract': 'Retract Up',
-            'slow': 'Slow Z Move'
-        }.get(move_type, 'Other')
-
-        ax.plot([last_x, x], [last_z, z], linestyle=style, color=color, label=label)
-
-        last_x, last_z = x, z  # Update for next segment
+    fig, ax = plt.subplots()
 
+    n = min(move_count, 50)  # Limit to first 50
+    ends = np.column_stack([move_xs[:n], move_zs[:n]])
+    starts = np.vstack([[0.0, 0.0], ends[:-1]])  # Start at origin or set initial known position
+    segments = np.stack([starts, ends], axis=1)
+    kinds = move_kinds[:n]
+
+    for move_type, color, style, label in (
+        (MOVE_RAPID, 'blue', '--', 'Rapid Move'),
+        (MOVE_SLOW, 'orange', '--', 'Slow Z Move'),
+        (MOVE_CUT, 'red', '-', 'Cut Down'),
+        (MOVE_RETRACT, 'green', '-', 'Retract Up'),
+    ):
+        mask = kinds == move_type
+        if mask.any():
+            ax.add_collection(LineCollection(segments[mask], colors=color, linestyles=style, label=label))
+
+    ax.autoscale_view()
     ax.set_xlabel('X (inches)')
     ax.set_ylabel('Z (inches)')
     ax.set_title('XZ Toolpath')
     ax.grid(True)
 
-    # Unique legend
-    handles, labels = plt.gca().get_legend_handles_labels()
-    by_label = dict(zip(labels, handles))
-    plt.legend(by_label.values(), by_label.keys())
+    ax.legend()
 
     plt.show()
 
 def main():
-    if os.path.exists(filename):
-        os.remove(filename)
+    global move_count
+    move_count = 0
+    _gcode_buffer.clear()
     write_header()
 
     y_position = -(blade_width_in / 2) - (wax_width_in / 2)
@@ -158,32 +205,15 @@ def main():
     slow_move_z(z_retract_height_in, 25)
     # rapid_move(retracted_x, y_position, z_retract_height_in)
 
-    for i in range(int(wax_length_in / cut_spacing_in)):
-        retracted_x = i * cut_spacing_in
-
-        # Log rapid move (assume last_x, last_z known)
-        # move_log.append((last_x, last_z, retracted_x, z_retract_height_in, 'rapid'))
-        slow_move_x(retracted_x, 1)
-
-        # Move down
-        inserted_x_pos, inserted_z_pos = angular_move(
-            cut_angle_deg,
-            retracted_x,
-            z_retract_height_in,
-            cut_depth_in + z_retract_height_in,
-            down=True
-        )
-
-        # Move up
-        last_x, last_z = angular_move(
-            cut_angle_deg,
-            inserted_x_pos,
-            inserted_z_pos,
-            cut_depth_in + z_retract_height_in,
-            down=False
-        )
-
-    plot_moves()
+    cut_moves(1)
+
+    flush()
+
+    if '--binary' in sys.argv:
+        write_binary(os.path.splitext(filename)[0] + '.bgc')
+
+    if '--plot' in sys.argv:
+        plot_moves()
 
 
 if __name__ == "__main__":